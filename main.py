@@ -131,12 +131,16 @@ def cmd_docx_extract(docx_path: str, output: str = None):
 # ------------------------- FILE RECOVERY -------------------------
 
 @recovery_app.command("run")
-def cmd_recovery(source_dir: str, output: str = None):
+def cmd_recovery(
+    source_dir: str,
+    output: str = None,
+    workers: int = typer.Option(1, help="Parallel scan processes (for SSD/RAID sources)")
+):
     """Recover deleted/lost files from a directory."""
     src = check_file_exists(source_dir, "Source directory")
     if output is None:
         output = str(Path(source_dir) / "recovered_files")
-    safe_exec(recover_files, str(src), output)
+    safe_exec(recover_files, str(src), output, workers=workers)
     typer.secho(f"[SUCCESS] Recovered files saved to {output}", fg=typer.colors.GREEN)
 
 
@@ -1,40 +1,102 @@
-from docx import Document
+import os
+import zipfile
+import multiprocessing
+import xml.etree.ElementTree as ET
+from datetime import datetime
 from pprint import pprint
 
+# Fixed schema of the OPC core properties (same names python-docx uses)
+_CORE_FIELDS = (
+    "author", "category", "comments", "content_status", "created",
+    "identifier", "keywords", "language", "last_modified_by", "last_printed",
+    "modified", "revision", "subject", "title", "version",
+)
+_DATE_FIELDS = ("created", "modified", "last_printed")
+
+# docProps/core.xml element (namespace-stripped) -> CoreProperties field
+_CORE_XML_TAGS = {
+    "creator": "author", "category": "category", "description": "comments",
+    "contentStatus": "content_status", "created": "created",
+    "identifier": "identifier", "keywords": "keywords", "language": "language",
+    "lastModifiedBy": "last_modified_by", "lastPrinted": "last_printed",
+    "modified": "modified", "revision": "revision", "subject": "subject",
+    "title": "title", "version": "version",
+}
+
 def extract_docx_metadata(docx_file: str):
-    doc = Document(docx_file)
-    core_properties = doc.core_properties
+    metadata = _extract_one(docx_file)
+
+    print("\n=== DOCX METADATA ===")
+    pprint(metadata)
+    return metadata
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _format_w3cdtf(text):
+    if not text:
+        return None
+    try:
+        value = datetime.fromisoformat(text.strip().replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return value.strftime("%Y-%m-%d %H:%M:%S")
 
-    metadata = {}
 
-    # Core properties
-    for prop in dir(core_properties):
-        if prop.startswith("__"):
-            continue
+def _extract_one(docx_file: str) -> dict:
+    """Read core/custom properties straight from the DOCX zip.
 
-        value = getattr(core_properties, prop)
+    Only docProps/core.xml and docProps/custom.xml (a few KiB) are streamed
+    through iterparse; word/document.xml is never opened.
+    """
+    metadata = {field: "" for field in _CORE_FIELDS}
+    metadata["revision"] = 0
 
-        if callable(value):
-            continue
+    with zipfile.ZipFile(docx_file) as archive:
+        names = set(archive.namelist())
 
-        # Fix datetime fields
-        if prop in ["created", "modified", "last_printed"]:
-            if value:
-                value = value.strftime("%Y-%m-%d %H:%M:%S")
-            else:
-                value = None
+        if "docProps/core.xml" in names:
+            with archive.open("docProps/core.xml") as f:
+                for _, element in ET.iterparse(f):
+                    field = _CORE_XML_TAGS.get(_local_name(element.tag))
+                    if field:
+                        metadata[field] = element.text or ""
 
-        metadata[prop] = value
+        if "docProps/custom.xml" in names:
+            custom = {}
+            with archive.open("docProps/custom.xml") as f:
+                for _, element in ET.iterparse(f):
+                    if _local_name(element.tag) == "property":
+                        custom[element.get("name")] = element[0].text if len(element) else None
+            if custom:
+                metadata["custom_properties"] = custom
 
-    # Custom properties (if available)
     try:
-        custom_props = core_properties.custom_properties
-        if custom_props:
-            metadata["custom_properties"] = {
-                prop.name: prop.value for prop in custom_props
-            }
-    except AttributeError:
-        pass
+        metadata["revision"] = int(metadata["revision"])
+    except ValueError:
+        metadata["revision"] = 0
+    for field in _DATE_FIELDS:
+        metadata[field] = _format_w3cdtf(metadata[field])
 
-    print("\n=== DOCX METADATA ===")
-    pprint(metadata)
+    return metadata
+
+
+def _extract_one_safe(docx_file: str) -> dict:
+    """_extract_one for the batch pool: a malformed file yields an error entry."""
+    try:
+        return _extract_one(docx_file)
+    except Exception as e:
+        return {"error": f"{type(e).__name__}: {e}"}
+
+
+def extract_docx_metadata_batch(paths: list) -> dict:
+    """Extract metadata from many DOCX files across all cores, keyed by path.
+
+    Files that cannot be read map to {"error": "..."} instead of aborting
+    the batch.
+    """
+    paths = list(paths)
+    with multiprocessing.Pool(os.cpu_count()) as pool:
+        return dict(zip(paths, pool.map(_extract_one_safe, paths, chunksize=16)))
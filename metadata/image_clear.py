@@ -1,11 +1,13 @@
 from PIL import Image
 
-def clear_image_metadata(img_path: str):
+def clear_image_metadata(img_path: str, out_path: str = None):
+    out_path = out_path or img_path
     img = Image.open(img_path)
-    data = list(img.getdata())
 
-    img_no_meta = Image.new(img.mode, img.size)
-    img_no_meta.putdata(data)
+    # Rebuild from the raw pixel buffer so no EXIF/ICC/text chunks carry over
+    img_no_meta = Image.frombytes(img.mode, img.size, img.tobytes())
+    if img.mode in ("P", "PA"):
+        img_no_meta.putpalette(img.getpalette())
 
-    img_no_meta.save(img_path)
+    img_no_meta.save(out_path)
     print(f"[OK] Metadata cleared from: {img_path}")
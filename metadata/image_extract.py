@@ -1,29 +1,36 @@
+from numbers import Rational
+
 from PIL import Image
 from PIL.ExifTags import TAGS
 
-def extract_image_metadata(img_path: str):
-    image = Image.open(img_path)
+def _exif_value(value):
+    """Convert an EXIF value into something json.dump can write."""
+    if isinstance(value, bytes):
+        return value.decode(errors="ignore")
+    if isinstance(value, Rational):
+        return float(value)
+    if isinstance(value, tuple):
+        return [_exif_value(v) for v in value]
+    return value
 
-    info_dict = {
-        "Filename": image.filename,
-        "Image Size": image.size,
-        "Image Height": image.height,
-        "Image Width": image.width,
-        "Image Format": image.format,
-        "Image Mode": image.mode,
-        "Image is Animated": getattr(image, "is_animated", False),
-        "Frames in Image": getattr(image, "n_frames", 1),
-    }
+def extract_image_metadata(img_path: str) -> dict:
+    # Image.open only parses the header (EXIF included); pixel data is never decoded here
+    with Image.open(img_path) as image:
+        metadata = {
+            "Filename": image.filename,
+            "Image Size": image.size,
+            "Image Height": image.height,
+            "Image Width": image.width,
+            "Image Format": image.format,
+            "Image Mode": image.mode,
+            "Image is Animated": getattr(image, "is_animated", False),
+            "Frames in Image": getattr(image, "n_frames", 1),
+        }
 
-    print("\n=== BASIC METADATA ===")
-    for k, v in info_dict.items():
-        print(f"{k:25}: {v}")
+        exifdata = image.getexif()
+        metadata["EXIF"] = {
+            TAGS.get(tag_id, tag_id): _exif_value(value)
+            for tag_id, value in exifdata.items()
+        }
 
-    print("\n=== EXIF DATA ===")
-    exifdata = image.getexif()
-    for tag_id in exifdata:
-        tag = TAGS.get(tag_id, tag_id)
-        data = exifdata.get(tag_id)
-        if isinstance(data, bytes):
-            data = data.decode(errors="ignore")
-        print(f"{tag:25}: {data}")
+    return metadata
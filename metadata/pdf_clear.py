@@ -1,23 +1,27 @@
-import PyPDF2
+import os
 
-def clear_pdf_metadata(pdf_file: str):
-    with open(pdf_file, "rb") as file:
-        reader = PyPDF2.PdfReader(file)
+import pikepdf
 
-        if reader.metadata is None:
+def clear_pdf_metadata(pdf_file: str, out_file: str = None):
+    if out_file is None:
+        out_file = f"{pdf_file.rsplit('.', 1)[0]}_clean.pdf"
+
+    # Only let pikepdf read the whole input into memory when it has to be overwritten
+    overwrite = os.path.abspath(out_file) == os.path.abspath(pdf_file)
+    with pikepdf.open(pdf_file, allow_overwriting_input=overwrite) as pdf:
+        has_xmp = "/Metadata" in pdf.Root
+
+        if not pdf.docinfo.keys() and not has_xmp:
             print("[INFO] No metadata found.")
             return
 
         print("[OK] Metadata detected. Creating clean PDF...")
 
-        writer = PyPDF2.PdfWriter()
-
-        for page in reader.pages:
-            writer.add_page(page)
-
-        out_file = f"{pdf_file.rsplit('.', 1)[0]}_clean.pdf"
+        # Drop the Info dictionary and the XMP stream; pages are copied by qpdf as-is
+        del pdf.docinfo
+        if has_xmp:
+            del pdf.Root.Metadata
 
-        with open(out_file, "wb") as f:
-            writer.write(f)
+        pdf.save(out_file)
 
-        print(f"[OK] Clean PDF saved as: {out_file}")
+    print(f"[OK] Clean PDF saved as: {out_file}")
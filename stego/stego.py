@@ -1,18 +1,57 @@
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
 import cv2
 import numpy as np
 
-def _to_bin(data):
-    """Convert data to binary string."""
-    if isinstance(data, str):
-        return ''.join(format(ord(i), "08b") for i in data)
-
-    if isinstance(data, bytes) or isinstance(data, np.ndarray):
-        return [format(i, "08b") for i in data]
-
-    if isinstance(data, int) or isinstance(data, np.uint8):
-        return format(data, "08b")
-
-    raise TypeError("Unsupported type.")
+try:
+    import xxhash
+except ImportError:  # optional; blake2b is used otherwise
+    xxhash = None
+
+_DELIMITER = b"====="
+
+# content hash -> decoded message; private to the user, oldest entries dropped first
+CACHE_PATH = Path.home() / ".forensicx" / "stego_cache.json"
+CACHE_MAX_ENTRIES = 256
+
+# The Numba kernels are opt-in (FORENSICX_NUMBA=1) and only used for arrays of
+# at least this many values; below that, import/cache-load and thread start-up
+# cost more than the NumPy path.
+USE_NUMBA = os.environ.get("FORENSICX_NUMBA") == "1"
+NUMBA_MIN_SIZE = 1 << 24
+
+_kernels = None
+
+
+def _lsb_kernels(size: int):
+    """Return Numba-compiled (write, read) LSB kernels, or None to use NumPy."""
+    global _kernels
+    if not USE_NUMBA or size < NUMBA_MIN_SIZE:
+        return None
+    if _kernels is None:
+        try:
+            from numba import njit, prange
+        except ImportError:
+            _kernels = False
+        else:
+            @njit(parallel=True, cache=True)
+            def _lsb_write(flat, bits):
+                for i in prange(bits.size):
+                    flat[i] = (flat[i] & 0xFE) | bits[i]
+
+            @njit(parallel=True, cache=True)
+            def _lsb_read(flat):
+                bits = np.empty(flat.size, dtype=np.uint8)
+                for i in prange(flat.size):
+                    bits[i] = flat[i] & 1
+                return bits
+
+            _kernels = (_lsb_write, _lsb_read)
+    return _kernels or None
 
 
 def encode_message(image_path: str, message: str, output_path: str):
@@ -22,65 +61,103 @@ def encode_message(image_path: str, message: str, output_path: str):
     if image is None:
         raise ValueError("Invalid image path.")
 
-    max_bytes = (image.size * 3) // 8
-    if len(message) > max_bytes:
+    payload = message.encode() + _DELIMITER
+    max_bytes = image.size // 8
+    if len(payload) > max_bytes:
         raise ValueError("Message too large for image.")
 
-    message += "====="
-    binary_data = _to_bin(message)
-    data_len = len(binary_data)
-    data_index = 0
+    bits = np.unpackbits(np.frombuffer(payload, dtype=np.uint8))
 
-    print(f"[INFO] Capacity: {max_bytes} bytes")
+    print(f"[INFO] Capacity: {max_bytes - len(_DELIMITER)} bytes")
     print("[INFO] Encoding message...")
 
-    for row in image:
-        for pixel in row:
-            r, g, b = _to_bin(pixel)
+    # One LSB per channel value, in the same B, G, R pixel order cv2 loads.
+    flat = image.reshape(-1)
+    kernels = _lsb_kernels(bits.size)
+    if kernels:
+        kernels[0](flat, bits)
+    else:
+        flat[:bits.size] = (flat[:bits.size] & 0xFE) | bits
 
-            if data_index < data_len:
-                pixel[0] = int(r[:-1] + binary_data[data_index], 2)
-                data_index += 1
+    cv2.imwrite(output_path, image)
+    print(f"[OK] Encoded image saved as: {output_path}")
 
-            if data_index < data_len:
-                pixel[1] = int(g[:-1] + binary_data[data_index], 2)
-                data_index += 1
 
-            if data_index < data_len:
-                pixel[2] = int(b[:-1] + binary_data[data_index], 2)
-                data_index += 1
+def _file_digest(data: bytes) -> str:
+    if xxhash is not None:
+        return xxhash.xxh3_128_hexdigest(data)
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _load_cache() -> dict:
+    try:
+        with open(CACHE_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    # A valid JSON list/number/string would make .get() raise in decode_message
+    return data if isinstance(data, dict) else {}
+
+
+def _store_cache(digest: str, message: str):
+    cache = _load_cache()
+    cache.pop(digest, None)
+    cache[digest] = message
+    while len(cache) > CACHE_MAX_ENTRIES:
+        del cache[next(iter(cache))]
+
+    tmp_path = None
+    try:
+        CACHE_PATH.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # Decoded messages are recovered secrets: write a 0600 temp file and
+        # swap it in atomically so the cache is never readable or half-written.
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_PATH.parent, prefix=".stego_cache.")
+        os.chmod(tmp_path, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, CACHE_PATH)
+    except OSError:
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
 
-            if data_index >= data_len:
-                break
 
-        if data_index >= data_len:
-            break
+def decode_message(image_path: str) -> str:
+    """Extract hidden message from an image encoded with LSB.
 
-    cv2.imwrite(output_path, image)
-    print(f"[OK] Encoded image saved as: {output_path}")
+    Results are cached by a hash of the file contents, so decoding the same
+    image again skips the pixel work; any change to the file changes the key.
+    """
+    print("[INFO] Decoding message...")
+    try:
+        with open(image_path, "rb") as f:
+            raw = f.read()
+    except OSError:
+        raise ValueError("Invalid image path.")
 
+    digest = _file_digest(raw)
+    cached = _load_cache().get(digest)
+    if cached is not None:
+        return cached
 
-def decode_message(image_path: str) -> str:
-    """Extract hidden message from an image encoded with LSB."""
-    print("[INFO] Decoding message...")
-    image = cv2.imread(image_path)
+    image = cv2.imdecode(np.frombuffer(raw, dtype=np.uint8), cv2.IMREAD_COLOR)
 
     if image is None:
         raise ValueError("Invalid image path.")
 
-    binary_data = ""
-
-    for row in image:
-        for pixel in row:
-            r, g, b = _to_bin(pixel)
-            binary_data += r[-1] + g[-1] + b[-1]
-
-    bytes_list = [binary_data[i:i+8] for i in range(0, len(binary_data), 8)]
+    flat = image.reshape(-1)
+    kernels = _lsb_kernels(flat.size)
+    bits = kernels[1](flat) if kernels else flat & 1
+    data = np.packbits(bits).tobytes()
 
-    decoded = ""
-    for byte in bytes_list:
-        decoded += chr(int(byte, 2))
-        if decoded.endswith("====="):
-            break
+    end = data.find(_DELIMITER)
+    found = end != -1
+    if not found:
+        end = max(0, len(data) - len(_DELIMITER))
 
-    return decoded[:-5]
+    message = data[:end].decode(errors="replace")
+    if found:
+        _store_cache(digest, message)
+    return message